@@ -1,6 +1,8 @@
+import io
+import sys
 from typing import Callable
 
-from colorama import Fore
+from colorama import Fore, Style
 
 from helpers import (
     validate_name,
@@ -12,7 +14,15 @@ from helpers import (
     validate_args_count,
     style_text,
 )
-from instances import AddressBook, Record
+from instances import AddressBook, Record, format_date
+
+# Full color states used by build_contacts_showcase, so segments need no reset.
+_BRIGHT_BLUE = Style.BRIGHT + Fore.BLUE
+_BRIGHT_CYAN = Style.BRIGHT + Fore.CYAN
+_BLUE = Style.NORMAL + Fore.BLUE
+_GREEN = Style.NORMAL + Fore.GREEN
+_MAGENTA = Style.NORMAL + Fore.MAGENTA
+_PLAIN = Style.NORMAL + Fore.RESET
 
 
 def greeting() -> str:
@@ -22,37 +32,43 @@ def greeting() -> str:
 def build_contacts_showcase(rows: list[tuple[str, str, str]]) -> str:
     """
     Render all contacts as a colored, card-like block.
+    Each segment switches color directly and a single reset closes the block.
     """
     if not rows:
         return ""
 
     base_width = 64
     header_text = " Address Book - All Contacts "
-    widest_line = max(
-        len(header_text),
-        max(len(f"[{idx}] {name}") for idx, (name, _, _) in enumerate(rows, 1)),
-        max(len(f"    Phones: {phones}") for _, phones, _ in rows),
-        max(len(f"    Birthday: {birthday}") for _, _, birthday in rows),
-    )
+    widest_line = len(header_text)
+    for idx, (name, phones, birthday) in enumerate(rows, 1):
+        # Lengths of "[idx] name", "    Phones: ..." and "    Birthday: ...".
+        widest_line = max(
+            widest_line,
+            len(str(idx)) + 3 + len(name),
+            12 + len(phones),
+            14 + len(birthday),
+        )
     content_width = max(base_width, widest_line)
 
-    top_border = style_text("=" * content_width, color=Fore.BLUE, bright=True)
-    divider = style_text("-" * content_width, color=Fore.BLUE)
-    header = style_text(header_text.center(content_width), color=Fore.BLUE, bright=True)
+    top_border = f"{_BRIGHT_BLUE}{'=' * content_width}\n"
+    divider = f"{_BLUE}{'-' * content_width}\n"
+    last_idx = len(rows)
 
-    lines: list[str] = [top_border, header, top_border]
+    buffer = io.StringIO()
+    write = buffer.write
+    write(top_border)
+    write(f"{header_text.center(content_width)}\n")
+    write(top_border)
 
     for idx, (name, phones, birthday) in enumerate(rows, 1):
-        name_line = style_text(f"[{idx}] {name}", color=Fore.CYAN, bright=True)
-        phone_line = f"    {style_text('Phones', color=Fore.BLUE, bright=True)}: {style_text(phones, color=Fore.GREEN)}"
-        birthday_line = f"    {style_text('Birthday', color=Fore.BLUE, bright=True)}: {style_text(birthday, color=Fore.MAGENTA)}"
+        write(f"{_BRIGHT_CYAN}[{idx}] {name}\n")
+        write(f"    {_BRIGHT_BLUE}Phones{_PLAIN}: {_GREEN}{phones}\n")
+        write(f"    {_BRIGHT_BLUE}Birthday{_PLAIN}: {_MAGENTA}{birthday}\n")
+        if idx != last_idx:
+            write(divider)
 
-        lines.extend([name_line, phone_line, birthday_line])
-        if idx != len(rows):
-            lines.append(divider)
-
-    lines.append(top_border)
-    return "\n".join(lines)
+    write(f"{_BRIGHT_BLUE}{'=' * content_width}{Style.RESET_ALL}")
+    return buffer.getvalue()
 
 
 @input_error
@@ -76,7 +92,7 @@ def add_contact(name: str, phone_number: str, address_book: AddressBook) -> bool
             raise ValueError(add_message)
         address_book.add_record(record)
     else:
-        if record.find_phone(phone_number):
+        if record.has_phone(phone_number):
             raise ValueError(f"Contact {name} already has this phone number.")
         add_message = record.add_phone(phone_number)
         if add_message != "Phone number is set":
@@ -98,7 +114,7 @@ def change_contact(name: str, new_phone_number: str, address_book: AddressBook)
     record = address_book.find(name)
     if record is None:
         raise ValueError("Contact not found.")
-    if record.find_phone(new_phone_number):
+    if record.has_phone(new_phone_number):
         raise ValueError(f"Contact {name} already has this phone number.")
 
     if not record.phones:
@@ -201,7 +217,7 @@ def get_contact_birthday(name: str, address_book: AddressBook) -> str | bool:
     if record.birthday is None:
         raise ValueError(f"Birthday for {name} is not set.")
 
-    return record.birthday.value.strftime("%d.%m.%Y")
+    return record.birthday.formatted
 
 
 @input_error
@@ -346,7 +362,7 @@ def handle_birthdays(args: list[str], address_book: AddressBook) -> None:
     if upcoming:
         lines = ["Upcoming birthdays (next 7 days):"]
         for name, date_value in upcoming:
-            lines.append(f"{name}: {date_value.strftime('%d.%m.%Y')}")
+            lines.append(f"{name}: {format_date(date_value)}")
         print(style_text("\n".join(lines), color=Fore.YELLOW))
 
 
@@ -365,7 +381,9 @@ def handle_phone(args: list[str], address_book: AddressBook) -> None:
     record = address_book.find(name)
     if record is None:
         raise ValueError(f"Contact {name} not found.")
-    phone_numbers = "; ".join(phone.value for phone in record.phones) or "No phone numbers"
+    phone_numbers = (
+        "; ".join([phone.value for phone in record.phones]) if record.phones else "No phone numbers"
+    )
     name_part = style_text(name, color=Fore.BLUE, bright=True)
     label_part = style_text("'s phone number(s): ", color=Fore.BLUE)
     phone_part = style_text(phone_numbers, color=Fore.BLUE, bright=True)
@@ -387,12 +405,15 @@ def handle_all(args: list[str], address_book: AddressBook) -> None:
         raise ValueError("No contacts found.")
     contacts = []
     for name, record in address_book.items():
-        phones = "; ".join(phone.value for phone in record.phones) or "No phone numbers"
-        birthday = record.birthday.value.strftime("%d.%m.%Y") if record.birthday else "No birthday"
+        phones = (
+            "; ".join([phone.value for phone in record.phones]) if record.phones else "No phone numbers"
+        )
+        birthday = record.birthday.formatted if record.birthday else "No birthday"
         contacts.append((name, phones, birthday))
 
     showcase = build_contacts_showcase(contacts)
-    print(showcase)
+    sys.stdout.write(showcase + "\n")
+    sys.stdout.flush()
 
 
 
@@ -1,12 +1,22 @@
 from collections.abc import Iterable
-from functools import wraps
+from functools import lru_cache, wraps
 from datetime import datetime
 import pickle
 from colorama import Fore, Style
-import re
 from instances import AddressBook
 
 
+@lru_cache(maxsize=64)
+def _style_prefix(color: str | None, bright: bool, styles: tuple[str, ...]) -> str:
+    """Build the escape-sequence prefix for a style combination."""
+    applied_styles = list(styles)
+    if bright:
+        applied_styles.append(Style.BRIGHT)
+    if color:
+        applied_styles.append(color)
+    return "".join(applied_styles)
+
+
 def style_text(
     text: str,
     *,
@@ -16,15 +26,7 @@ def style_text(
     reset: bool = True,
 ) -> str:
     """Return text wrapped in the provided Colorama styles."""
-    applied_styles: list[str] = []
-    if styles:
-        applied_styles.extend(styles)
-    if bright:
-        applied_styles.append(Style.BRIGHT)
-    if color:
-        applied_styles.append(color)
-
-    prefix = "".join(applied_styles)
+    prefix = _style_prefix(color, bright, tuple(styles) if styles else ())
     suffix = Style.RESET_ALL if reset else ""
     return f"{prefix}{text}{suffix}"
 
@@ -62,21 +64,22 @@ def display_success_message(message: str) -> None:
 def parse_input(user_input: str) -> tuple[str, list[str]]:
     """
     Parses user input for commands and arguments.
-    Normalizes and validates the input.
+    Only the command is lowercased; arguments such as names keep their casing.
     Args:
         user_input (str): The raw input string from the user.
     Returns:
         tuple[str, list[str]]: A tuple containing the command and a list of arguments.
     """
-    parts = user_input.strip().lower().split()
-    command = parts[0] if parts else ''
-    args = parts[1:] if len(parts) > 1 else []
-    return command, args
+    parts = user_input.strip().split()
+    if not parts:
+        return '', []
+    return parts[0].lower(), parts[1:]
 
 
 def validate_name(name: str) -> bool:
     """
     Validates the name format.
+    Any Unicode letters are accepted, so non-Latin names remain valid.
     Args:
         name (str): The name to validate.
     Returns:
@@ -95,8 +98,15 @@ def validate_phone_number(phone_number: str) -> bool:
     Returns:
         bool: True if valid, False otherwise.
     """
-    pattern = re.compile(r'^(?:\+\d{7,15}|0\d{6,14})$')
-    return bool(pattern.match(phone_number))
+    length = len(phone_number)
+    if length < 7:
+        return False
+    first_char = phone_number[0]
+    if first_char == '+':
+        return 8 <= length <= 16 and phone_number[1:].isdecimal()
+    if first_char == '0':
+        return 7 <= length <= 15 and phone_number[1:].isdecimal()
+    return False
 
 
 def validate_args_count(args: list[str], expected_len: int, usage_hint: str) -> bool:
@@ -1,16 +1,50 @@
-from collections import UserDict
+from calendar import isleap
 from datetime import date, datetime, timedelta
+from operator import itemgetter
+
+
+def format_date(value: date) -> str:
+    """Format a date as DD.MM.YYYY without going through strftime."""
+    return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+
+
+def _next_leap_year(year: int) -> int:
+    """Return the first leap year on or after the given year."""
+    candidate = year + (-year % 4)
+    if not isleap(candidate):
+        # Century years skipped by the Gregorian rule; the next multiple of 4 is leap.
+        candidate += 4
+    return candidate
+
+
+def _next_birthday(birthday_date: date, today: date) -> date:
+    """Return the next occurrence of a birthday on or after today."""
+    if (birthday_date.month, birthday_date.day) == (2, 29):
+        # Leap-day birthdays are only counted on an actual Feb 29.
+        candidate = date(_next_leap_year(today.year), 2, 29)
+        if candidate < today:
+            candidate = date(_next_leap_year(candidate.year + 1), 2, 29)
+        return candidate
+
+    candidate = date(today.year, birthday_date.month, birthday_date.day)
+    if candidate < today:
+        candidate = date(today.year + 1, birthday_date.month, birthday_date.day)
+    return candidate
+
 
 class Field:
     def __init__(self):
-        self._value = None
+        self.value = None
 
-    @property
-    def value(self):
-        return self._value
+    def __setstate__(self, state):
+        """Restore attributes, renaming the '_value' key used by older pickles."""
+        state = dict(state)
+        if "_value" in state:
+            state["value"] = state.pop("_value")
+        self.__dict__.update(state)
 
     def __str__(self):
-        return str(self._value) if self._value is not None else ""
+        return str(self.value) if self.value is not None else ""
 
 
 class Name(Field):
@@ -21,7 +55,7 @@ class Name(Field):
 
     def set_name(self, name: str) -> str:
         """Set name value (assumes validation is handled externally)."""
-        self._value = name
+        self.value = name
         return "Name is set"
 
 
@@ -33,18 +67,21 @@ class Phone(Field):
 
     def add_phone(self, phone: str) -> str:
         """Set phone number."""
-        self._value = phone
+        self.value = phone
         return "Phone number is set"
 
     def delete_phone(self) -> str:
         """Delete phone number value."""
-        if self._value is None:
+        if self.value is None:
             return "No phone number to delete"
-        self._value = None
+        self.value = None
         return "Phone number is deleted"
 
 
 class Birthday(Field):
+    # Class-level default keeps birthdays pickled before caching existed loadable.
+    _formatted: str | None = None
+
     def __init__(self, birthday: str):
         """Initialize Birthday instance and set birthday value."""
         super().__init__()
@@ -52,42 +89,80 @@ class Birthday(Field):
 
     def add_birthday(self, birthday: str) -> str:
         """Set birthday value"""
-        if self._value is not None:
+        if self.value is not None:
             return "Birthday already set"
-        self._value = datetime.strptime(birthday, "%d.%m.%Y").date()
+        self.value = datetime.strptime(birthday, "%d.%m.%Y").date()
+        self._formatted = format_date(self.value)
         return "Birthday is set"
 
+    @property
+    def formatted(self) -> str:
+        """Birthday as a DD.MM.YYYY string, cached since the date never changes."""
+        if self._formatted is None:
+            self._formatted = format_date(self.value)
+        return self._formatted
+
 
 class Record:
+    # Set by the owning AddressBook so birthday changes invalidate its caches.
+    _on_change = None
+
     def __init__(self, name):
         self.name = Name(name)
         self.phones = []
+        self._phone_index: dict[str, Phone] = {}
         self.birthday = None
 
+    def __getstate__(self):
+        """Leave the phone index and owner callback out of pickles; both are restored on load."""
+        state = self.__dict__.copy()
+        state.pop("_phone_index", None)
+        state.pop("_on_change", None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore attributes and rebuild the phone index, dropping duplicate numbers."""
+        self.__dict__.update(state)
+        self._phone_index = {}
+        unique_phones = []
+        for phone in self.phones:
+            if phone.value not in self._phone_index:
+                self._phone_index[phone.value] = phone
+                unique_phones.append(phone)
+        self.phones = unique_phones
+
     def add_phone(self, phone_number: str) -> str:
         """Create and store a phone (assumes validation is handled externally)."""
+        if phone_number in self._phone_index:
+            return "Phone number already exists"
         phone = Phone(phone_number)
         self.phones.append(phone)
+        self._phone_index[phone_number] = phone
         return "Phone number is set"
 
     def find_phone(self, phone_number: str):
         """Return the Phone instance matching the number, if any."""
-        for phone in self.phones:
-            if phone.value == phone_number:
-                return phone
-        return None
+        return self._phone_index.get(phone_number)
+
+    def has_phone(self, phone_number: str) -> bool:
+        """Check whether the record already holds the given number."""
+        return phone_number in self._phone_index
 
     def edit_phone(self, old_number: str, new_number: str) -> str:
         """Replace an existing phone with a new value."""
-        phone = self.find_phone(old_number)
+        phone = self._phone_index.get(old_number)
         if phone is None:
             return "Phone number not found"
-        phone._value = new_number
+        if new_number != old_number and new_number in self._phone_index:
+            return "Phone number already exists"
+        del self._phone_index[old_number]
+        phone.value = new_number
+        self._phone_index[new_number] = phone
         return "Phone number is set"
 
     def remove_phone(self, phone_number: str) -> str:
         """Remove a phone number from the record."""
-        phone = self.find_phone(phone_number)
+        phone = self._phone_index.pop(phone_number, None)
         if phone is None:
             return "Phone number not found"
         self.phones.remove(phone)
@@ -98,6 +173,7 @@ class Record:
         if self.birthday is not None:
             return "Birthday already set"
         self.birthday = Birthday(birthday)
+        self._notify_change()
         return "Birthday is set"
 
     def remove_birthday(self) -> str:
@@ -105,8 +181,14 @@ class Record:
         if self.birthday is None:
             return "Birthday not set"
         self.birthday = None
+        self._notify_change()
         return "Birthday is deleted"
 
+    def _notify_change(self) -> None:
+        """Tell the owning address book, if any, that this record changed."""
+        if self._on_change is not None:
+            self._on_change()
+
     def days_to_birthday(self) -> int | None:
         """
         Calculate days until the next birthday.
@@ -117,70 +199,116 @@ class Record:
             return None
 
         today = date.today()
-        birthday_date = self.birthday.value
-        next_year = today.year
-
-        while True:
-            try:
-                candidate = birthday_date.replace(year=next_year)
-            except ValueError:
-                next_year += 1
-                continue
-
-            if candidate >= today:
-                return (candidate - today).days
-            next_year += 1
+        return (_next_birthday(self.birthday.value, today) - today).days
 
     def __str__(self):
-        phones = '; '.join(str(single_phone) for single_phone in self.phones) or "No phone numbers"
+        phones = '; '.join([str(single_phone) for single_phone in self.phones]) or "No phone numbers"
         birthday_part = (
-            f", birthday: {self.birthday.value.strftime('%d.%m.%Y')}" if self.birthday else ""
+            f", birthday: {self.birthday.formatted}" if self.birthday else ""
         )
         return f"Contact name: {self.name}{birthday_part}, phones: {phones}"
 
 
-class AddressBook(UserDict):
+class AddressBook(dict):
+    # A plain dict base keeps lookups fast, but its C-level mutators skip any
+    # override. The birthdays cache is only kept correct when records change
+    # through add_record, delete and clear, not raw item assignment or update.
+
+    # Class-level defaults keep books pickled before these fields existed loadable.
+    _version = 0
+    _upcoming_cache: tuple[date, int, int, list[tuple[str, date]]] | None = None
+
+    def __getstate__(self):
+        """Leave the birthdays cache out of pickles; it is recomputed on demand."""
+        state = self.__dict__.copy()
+        state.pop("_upcoming_cache", None)
+        state.pop("_version", None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore attributes, migrating books pickled when this was a UserDict."""
+        state = dict(state)
+        legacy_records = state.pop("data", None)
+        self.__dict__.update(state)
+        if legacy_records:
+            self.update(legacy_records)
+        for record in self.values():
+            record._on_change = self.bump
+
+    def bump(self) -> None:
+        """Mark the book as changed so cached lookups are recomputed."""
+        self._version += 1
+
+    def _detach(self, record: Record) -> None:
+        """Stop a record that left the book from notifying it."""
+        if record._on_change == self.bump:
+            record._on_change = None
+
     def add_record(self, record: Record) -> str:
         """Add a new record to the address book."""
-        self.data[record.name.value] = record
+        name = record.name.value
+        previous = self.get(name)
+        if previous is not None and previous is not record:
+            self._detach(previous)
+        self[name] = record
+        record._on_change = self.bump
+        self.bump()
         return "Record added"
 
     def find(self, name: str):
         """Find a record by name."""
-        return self.data.get(name)
+        return self.get(name)
 
     def delete(self, name: str) -> str:
         """Delete a record by name."""
-        if name in self.data:
-            del self.data[name]
+        if name in self:
+            self._detach(self.pop(name))
+            self.bump()
             return "Record deleted"
         return "Record not found"
 
+    def clear(self) -> None:
+        """Remove every record from the address book."""
+        for record in self.values():
+            self._detach(record)
+        super().clear()
+        self.bump()
+
     def phone_exists(self, phone_number: str, exclude_name: str | None = None) -> bool:
         """Check if a phone number is used by any contact except the excluded one."""
-        for name, record in self.data.items():
+        for name, record in self.items():
             if exclude_name and name == exclude_name:
                 continue
-            if any(phone.value == phone_number for phone in record.phones):
+            if record.has_phone(phone_number):
                 return True
         return False
 
     def upcoming_birthdays(self, days: int = 7) -> list[tuple[str, date]]:
         """
         Return contacts with birthdays within the next given number of days.
+        Results are cached per day until the book changes through add_record,
+        delete or clear, or one of its records changes its birthday.
+        Writing to the dict directly (book[name] = ...) bypasses the cache.
         Args:
             days (int): Range looking forward from today.
         Returns:
             list[tuple[str, date]]: List of tuples with contact name and upcoming birthday date.
         """
         today = date.today()
+        cached = self._upcoming_cache
+        if cached is not None and cached[:3] == (today, self._version, days):
+            return list(cached[3])
+
+        horizon = today + timedelta(days=days)
         upcoming: list[tuple[str, date]] = []
-        for record in self.data.values():
-            days_left = record.days_to_birthday()
-            if days_left is None:
+        for record in self.values():
+            birthday = record.birthday
+            if birthday is None:
                 continue
-            if 0 <= days_left <= days:
-                upcoming.append((record.name.value, today + timedelta(days=days_left)))
+            occurrence = _next_birthday(birthday.value, today)
+            if occurrence <= horizon:
+                upcoming.append((record.name.value, occurrence))
 
-        upcoming.sort(key=lambda item: item[1])
-        return upcoming
+        upcoming.sort(key=itemgetter(1))
+        self._upcoming_cache = (today, self._version, days, upcoming)
+        return list(upcoming)
@@ -4,8 +4,8 @@ import threading
 import time
 
 import colorama
-from colorama import Fore
-from functools import partial
+from colorama import Fore, Style
+from functools import cache
 
 from helpers import (
     parse_input,
@@ -55,18 +55,21 @@ def display_logo() -> None:
     """Render the static logo with Colorama accents."""
     lines = LOGO.strip("\n").splitlines()
     creator_line = "    Hlib boiko - creator"
-    accent_colors = [Fore.CYAN, Fore.MAGENTA, Fore.BLUE]
+    palette = itertools.cycle((Fore.CYAN, Fore.MAGENTA, Fore.BLUE))
 
-    for idx, line in enumerate(lines):
-        ink = accent_colors[idx % len(accent_colors)]
-        print(style_text(line, color=ink, bright=True))
-    print(style_text(creator_line, color=Fore.YELLOW, bright=True))
-    print()
+    buffer = [
+        f"{Style.BRIGHT}{ink}{line}{Style.RESET_ALL}"
+        for line, ink in zip(lines, palette)
+    ]
+    buffer.append(f"{Style.BRIGHT}{Fore.YELLOW}{creator_line}{Style.RESET_ALL}")
+    sys.stdout.write("\n".join(buffer) + "\n\n")
 
 
+@cache
 def main_menu() -> str:
     """
     Displays the main menu options to the user.
+    The menu never changes, so it is built once and reused.
     Returns:
         str: The main menu string.
     """
@@ -114,7 +117,12 @@ def main_menu() -> str:
 def input_with_spinner(message: str, interval: float = 0.15) -> str:
     """
     Show a single-line spinner beside the given message while waiting for Enter.
+    Falls back to a plain prompt when stdout is not a terminal.
     """
+    if not sys.stdout.isatty():
+        print(message)
+        return input()
+
     spinner_cycle = itertools.cycle("/-\\|")
     stop_event = threading.Event()
     line = style_text(message, color=Fore.YELLOW, bright=True)
@@ -139,22 +147,23 @@ def input_with_spinner(message: str, interval: float = 0.15) -> str:
         print()
 
 """
-Command to handler mapping
+Command to (handler, extra argument) mapping.
+The extra argument, when not None, is passed positionally after args.
 """
 COMMAND_HANDLERS = {
-    'hello': handle_hello,
-    'add': partial(handle_add, address_book=ADDRESS_BOOK),
-    'change': partial(handle_change, address_book=ADDRESS_BOOK),
-    'delete': partial(handle_delete, address_book=ADDRESS_BOOK),
-    'add-birthday': partial(handle_add_birthday, address_book=ADDRESS_BOOK),
-    'delete-birthday': partial(handle_delete_birthday, address_book=ADDRESS_BOOK),
-    'show-birthday': partial(handle_show_birthday, address_book=ADDRESS_BOOK),
-    'birthdays': partial(handle_birthdays, address_book=ADDRESS_BOOK),
-    'phone': partial(handle_phone, address_book=ADDRESS_BOOK),
-    'delete-phone': partial(handle_delete_phone, address_book=ADDRESS_BOOK),
-    'all': partial(handle_all, address_book=ADDRESS_BOOK),
-    'clear-all': partial(handle_clear_all, address_book=ADDRESS_BOOK),
-    'menu': partial(handle_menu, menu_provider=main_menu),
+    'hello': (handle_hello, None),
+    'add': (handle_add, ADDRESS_BOOK),
+    'change': (handle_change, ADDRESS_BOOK),
+    'delete': (handle_delete, ADDRESS_BOOK),
+    'add-birthday': (handle_add_birthday, ADDRESS_BOOK),
+    'delete-birthday': (handle_delete_birthday, ADDRESS_BOOK),
+    'show-birthday': (handle_show_birthday, ADDRESS_BOOK),
+    'birthdays': (handle_birthdays, ADDRESS_BOOK),
+    'phone': (handle_phone, ADDRESS_BOOK),
+    'delete-phone': (handle_delete_phone, ADDRESS_BOOK),
+    'all': (handle_all, ADDRESS_BOOK),
+    'clear-all': (handle_clear_all, ADDRESS_BOOK),
+    'menu': (handle_menu, main_menu),
 }
 
 
@@ -174,18 +183,26 @@ def _handle_command(command: str, args: list[str]) -> None:
         handle_exit(args)
         return
 
-    handler = COMMAND_HANDLERS.get(command)
-    if handler:
+    entry = COMMAND_HANDLERS.get(command)
+    if entry is None:
+        display_error_message("Unknown command. Type 'menu' to see available options.")
+        return
+
+    handler, extra = entry
+    if extra is None:
         handler(args)
     else:
-        display_error_message("Unknown command. Type 'menu' to see available options.")
+        handler(args, extra)
 
 
 def main():
     """
     Main function to run the command-line bot application.
     """
-    colorama.init(autoreset=True)
+    if sys.platform == "win32" or not sys.stdout.isatty():
+        # Colorama converts codes on Windows and strips them from piped output;
+        # a POSIX terminal handles ANSI natively, so stdout is left unwrapped there.
+        colorama.init()
     try:
         display_logo()
         try: